@@ -1,25 +1,50 @@
 from __future__ import annotations
 
 import argparse
+import contextlib
+import functools
+import importlib.util
+import io
 import json
 import logging
-import subprocess
+import os
+import pickle
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from collections import deque
+from concurrent.futures import BrokenExecutor, Executor, Future, ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Iterable
+from types import MappingProxyType
+from typing import IO, Any, Callable, Iterable, Mapping, Sequence
 
 from scripts.types import OCRBatchSummary, OCRJobSummary, ValidationSummary
 
 try:
-    import yaml
-except ImportError as exc:  # pragma: no cover - import guard
-    raise SystemExit(
-        "PyYAML is required to load OCR profiles. Install it with `pip install pyyaml`."
-    ) from exc
+    import orjson
+except ImportError:  # pragma: no cover - optional accelerator, fall back to the stdlib encoder
+    orjson = None
 
 LOGGER = logging.getLogger("ocr_cli")
 LOGGER.propagate = False
 
+# Resolved once so each job skips the $PATH search; fall back to the bare name for a clear spawn error.
+OCRMYPDF_BIN = shutil.which("ocrmypdf") or "ocrmypdf"
+PROFILE_CACHE_PATH: Path | None = None  # Overrides the default location, see profile_cache_path().
+PROFILE_CACHE_SLOTS = 8  # Distinct --profiles files remembered in the cache.
+# No exit code is retried by default; ocrmypdf has no dedicated code for transient failures.
+DEFAULT_RETRY_RETURNCODES: tuple[int, ...] = ()
+RETRY_ATTEMPTS = 3
+OUTPUT_TAIL_LINES = 64  # Only the most recent ocrmypdf output lines are kept per stream.
+OCR_WORKER_MAX_TASKS = 32  # Files an in-process OCR worker handles before it is replaced.
+# Options that ocrmypdf.ocr() takes positionally, ignores, or that are set explicitly per call.
+API_MANAGED_OPTIONS = frozenset({"input_file", "output_file", "verbose", "progress_bar"})
+# ocrmypdf argparse destinations whose ocrmypdf.ocr() keyword argument has a different name.
+OCR_KWARG_ALIASES = {"languages": "language"}
+
 
 class JsonLogFormatter(logging.Formatter):
     """Simple JSON formatter to keep log output structured."""
@@ -34,9 +59,36 @@ class JsonLogFormatter(logging.Formatter):
             payload["exception"] = self.formatException(record.exc_info)
         for key, value in getattr(record, "structured_data", {}).items():
             payload[key] = value
+        if orjson is not None:
+            try:
+                return orjson.dumps(payload).decode()
+            except orjson.JSONEncodeError:
+                # orjson rejects lone surrogates, which os.fsdecode() produces for non-UTF-8 file names.
+                pass
         return json.dumps(payload)
 
 
+def emit_json(payload: Any) -> None:
+    """Write ``payload`` to stdout as a single line of JSON."""
+    if orjson is None:
+        print(json.dumps(payload))
+        return
+    try:
+        # Appending the newline inside orjson avoids a second write or a copy of a large batch summary.
+        data = orjson.dumps(payload, option=orjson.OPT_APPEND_NEWLINE)
+    except orjson.JSONEncodeError:
+        # Lone surrogates from non-UTF-8 file names; json escapes them instead of dropping the summary.
+        print(json.dumps(payload))
+        return
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:  # stdout replaced by a text-only stream, e.g. contextlib.redirect_stdout(io.StringIO())
+        sys.stdout.write(data.decode())
+        return
+    # orjson already produces UTF-8 bytes, so bypass the text layer once pending text is flushed.
+    sys.stdout.flush()
+    buffer.write(data)
+
+
 def configure_logging(verbose: bool) -> None:
     """Configure structured logging for the CLI."""
     LOGGER.handlers.clear()
@@ -51,12 +103,51 @@ class OCRProfile:
     name: str
     description: str
     ocrmypdf_args: tuple[str, ...]
+    retry_returncodes: tuple[int, ...] = DEFAULT_RETRY_RETURNCODES
+
+
+def load_profiles(profile_path: Path) -> Mapping[str, OCRProfile]:
+    """Load OCR profiles from a YAML file, reusing cached results while it is unchanged."""
+    resolved_path = profile_path.expanduser().resolve()
+    stat_result = resolved_path.stat()
+    return _load_profiles_cached(str(resolved_path), stat_result.st_mtime_ns, stat_result.st_size)
+
+
+@functools.lru_cache(maxsize=PROFILE_CACHE_SLOTS)
+def _load_profiles_cached(path: str, mtime_ns: int, size: int) -> Mapping[str, OCRProfile]:
+    """Parse the profile file identified by ``path`` and its stat fingerprint.
 
+    The result is shared between callers, so it is returned as a read-only mapping.
+    """
+    cache_key = (path, mtime_ns, size)
+    raw_profiles = read_profile_cache(cache_key)
+    if raw_profiles is not None:
+        LOGGER.debug("Loaded profiles from cache", extra={"structured_data": {"profiles": path}})
+        return MappingProxyType(build_profiles(raw_profiles))
+    raw_profiles = parse_profile_yaml(path)
+    profiles = build_profiles(raw_profiles)
+    write_profile_cache(cache_key, raw_profiles)
+    return MappingProxyType(profiles)
 
-def load_profiles(profile_path: Path) -> dict[str, OCRProfile]:
-    """Load OCR profiles from a YAML file."""
-    with profile_path.open("r", encoding="utf-8") as stream:
-        raw_profiles = yaml.safe_load(stream) or {}
+
+def parse_profile_yaml(path: str) -> Any:
+    """Parse a profile YAML file, importing PyYAML only when a parse is actually needed."""
+    try:
+        import yaml
+    except ImportError as exc:  # pragma: no cover - import guard
+        raise SystemExit(
+            "PyYAML is required to load OCR profiles. Install it with `pip install pyyaml`."
+        ) from exc
+    try:
+        from yaml import CSafeLoader as YamlLoader
+    except ImportError:  # pragma: no cover - PyYAML built without libyaml, use the pure-Python loader
+        from yaml import SafeLoader as YamlLoader
+    with open(path, "r", encoding="utf-8") as stream:
+        return yaml.load(stream, Loader=YamlLoader) or {}
+
+
+def build_profiles(raw_profiles: Any) -> dict[str, OCRProfile]:
+    """Validate parsed profile data and convert it into ``OCRProfile`` instances."""
     if not isinstance(raw_profiles, dict):
         raise ValueError("Profile configuration must be a mapping of profile names.")
     profiles: dict[str, OCRProfile] = {}
@@ -68,16 +159,200 @@ def load_profiles(profile_path: Path) -> dict[str, OCRProfile]:
         if isinstance(raw_args, (str, bytes)) or not isinstance(raw_args, Iterable):
             raise ValueError(f"Profile '{name}' must define iterable 'ocrmypdf_args'.")
         args = tuple(str(arg) for arg in raw_args)
-        profiles[name] = OCRProfile(name=name, description=description, ocrmypdf_args=args)
+        raw_retry = data.get("retry_returncodes", DEFAULT_RETRY_RETURNCODES)
+        # bool is an int subclass; reject it so a YAML ``true`` cannot silently mean exit code 1.
+        if not isinstance(raw_retry, (list, tuple)) or not all(
+            isinstance(code, int) and not isinstance(code, bool) for code in raw_retry
+        ):
+            raise ValueError(f"Profile '{name}' must define 'retry_returncodes' as a list of integers.")
+        profiles[name] = OCRProfile(
+            name=name,
+            description=description,
+            ocrmypdf_args=args,
+            retry_returncodes=tuple(raw_retry),
+        )
     return profiles
 
 
-def resolve_profile(name: str, profiles: dict[str, OCRProfile]) -> OCRProfile:
-    """Resolve a profile name to a concrete ``OCRProfile`` instance."""
+def profile_cache_path() -> Path | None:
+    """Return the profile cache file path, or ``None`` when there is no cache directory to use."""
+    if PROFILE_CACHE_PATH is not None:
+        return PROFILE_CACHE_PATH
+    cache_home = os.environ.get("XDG_CACHE_HOME", "")
+    # The XDG spec says to ignore relative paths and fall back to ~/.cache.
+    if not os.path.isabs(cache_home):
+        try:
+            cache_home = os.fspath(Path.home() / ".cache")
+        except RuntimeError:  # Neither $HOME nor a passwd entry; run without the cache.
+            return None
+    return Path(cache_home) / "ocr_cli" / "profiles.pkl"
+
+
+def read_profile_cache_entries() -> dict[str, tuple[tuple[str, int, int], Any]]:
+    """Return the cached raw profile data, keyed by resolved profile file path."""
+    cache_path = profile_cache_path()
+    if cache_path is None:
+        return {}
     try:
-        return profiles[name]
-    except KeyError as exc:
-        raise KeyError(f"Unknown profile '{name}'. Available profiles: {', '.join(sorted(profiles))}") from exc
+        with cache_path.open("rb") as stream:
+            entries = pickle.load(stream)
+    except Exception:  # A missing or unreadable cache only means the YAML gets parsed again.
+        return {}
+    return entries if isinstance(entries, dict) else {}
+
+
+def read_profile_cache(cache_key: tuple[str, int, int]) -> Any | None:
+    """Return the raw profile data pickled for ``cache_key``, or ``None`` on a miss."""
+    entry = read_profile_cache_entries().get(cache_key[0])
+    if entry is None or entry[0] != cache_key:
+        return None
+    return entry[1]
+
+
+def write_profile_cache(cache_key: tuple[str, int, int], raw_profiles: Any) -> None:
+    """Persist raw profile data so later invocations can skip YAML parsing."""
+    cache_path = profile_cache_path()
+    if cache_path is None:
+        return
+    entries = read_profile_cache_entries()
+    # Re-insert so the most recently used profile files are the ones kept.
+    entries.pop(cache_key[0], None)
+    entries[cache_key[0]] = (cache_key, raw_profiles)
+    while len(entries) > PROFILE_CACHE_SLOTS:
+        del entries[next(iter(entries))]
+    temp_path: str | None = None
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile("wb", dir=cache_path.parent, delete=False) as stream:
+            temp_path = stream.name
+            pickle.dump(entries, stream, protocol=pickle.HIGHEST_PROTOCOL)
+        # Replace atomically so concurrent invocations never read a partially written cache.
+        os.replace(temp_path, cache_path)
+    except Exception as error:  # Caching is best effort and must never fail a run.
+        LOGGER.debug("Unable to write profile cache", extra={"structured_data": {"error": str(error)}})
+        if temp_path is not None:
+            with contextlib.suppress(OSError):
+                os.unlink(temp_path)
+
+
+def make_resolver(profiles: Mapping[str, OCRProfile]) -> Callable[[str], OCRProfile]:
+    """Return a function resolving profile names to concrete ``OCRProfile`` instances."""
+    available = ", ".join(sorted(profiles))
+
+    def resolve_profile(name: str) -> OCRProfile:
+        try:
+            return profiles[name]
+        except KeyError as exc:
+            raise KeyError(f"Unknown profile '{name}'. Available profiles: {available}") from exc
+
+    return resolve_profile
+
+
+def drain_stream(stream: IO[str], lines: deque[str]) -> None:
+    """Consume ``stream`` line by line, keeping only what fits in ``lines``."""
+    with stream:
+        for line in stream:
+            lines.append(line)
+
+
+def parse_ocrmypdf_args(args: Sequence[str]) -> dict[str, Any]:
+    """Translate ocrmypdf command-line arguments into ``ocrmypdf.ocr()`` keyword arguments.
+
+    Raises ``ValueError`` with ocrmypdf's own message when it rejects ``args``.
+    """
+    # This is the plugin-aware parser the ocrmypdf CLI uses; plugins contribute options such as --optimize.
+    from ocrmypdf._plugin_manager import get_parser_options_plugins
+
+    placeholders = ["input.pdf", "output.pdf"]
+    # Use a separate parser for the defaults: some ocrmypdf actions append to their shared default list.
+    _parser, defaults, _plugin_manager = get_parser_options_plugins(placeholders)
+    # The parser runs in CLI mode, so rejected arguments print usage to stderr and raise SystemExit.
+    usage_output = io.StringIO()
+    try:
+        with contextlib.redirect_stderr(usage_output):
+            _parser, options, _plugin_manager = get_parser_options_plugins([*args, *placeholders])
+    except SystemExit as exc:
+        lines = usage_output.getvalue().strip().splitlines()
+        raise ValueError(lines[-1] if lines else "ocrmypdf rejected the arguments") from exc
+    return {
+        OCR_KWARG_ALIASES.get(key, key): value
+        for key, value in vars(options).items()
+        if key not in API_MANAGED_OPTIONS and value != getattr(defaults, key)
+    }
+
+
+def select_ocr_kwargs(
+    args: argparse.Namespace,
+    profile: OCRProfile,
+    extra_args: tuple[str, ...],
+) -> dict[str, Any] | None:
+    """Return keyword arguments for in-process OCR, or ``None`` to spawn the ocrmypdf executable."""
+    if args.subprocess:
+        return None
+    if importlib.util.find_spec("ocrmypdf") is None:
+        LOGGER.info("ocrmypdf Python package not found; using the ocrmypdf executable")
+        return None
+    try:
+        return parse_ocrmypdf_args((*profile.ocrmypdf_args, *extra_args))
+    except ValueError as error:
+        LOGGER.error(
+            "Invalid ocrmypdf arguments",
+            extra={"structured_data": {"profile": profile.name, "error": str(error)}},
+        )
+        raise SystemExit(f"Invalid ocrmypdf arguments for profile '{profile.name}': {error}") from error
+
+
+def init_ocr_worker() -> None:
+    """Import ocrmypdf once per worker process so every job it runs reuses the loaded package."""
+    import ocrmypdf  # noqa: F401
+
+
+def run_ocr_subprocess(command: list[str]) -> tuple[int, str, str]:
+    """Spawn the ocrmypdf executable and return its exit code and the tail of its output."""
+    import subprocess  # Deferred: only the subprocess engine needs it.
+
+    stdout_tail: deque[str] = deque(maxlen=OUTPUT_TAIL_LINES)
+    stderr_tail: deque[str] = deque(maxlen=OUTPUT_TAIL_LINES)
+    # With an absolute executable path and close_fds=False, CPython launches the child via
+    # posix_spawn. Descriptors Python opens are non-inheritable (PEP 446), so nothing leaks.
+    with subprocess.Popen(
+        command,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        # Tesseract and Ghostscript output is not guaranteed to be valid UTF-8; never let a stray byte
+        # kill a drain thread and break the pipe under a running ocrmypdf.
+        encoding="utf-8",
+        errors="replace",
+        bufsize=1,
+        close_fds=False,
+    ) as process:
+        # Drain stderr on a helper thread so neither pipe can fill up and stall ocrmypdf.
+        stderr_reader = threading.Thread(target=drain_stream, args=(process.stderr, stderr_tail), daemon=True)
+        stderr_reader.start()
+        drain_stream(process.stdout, stdout_tail)
+        stderr_reader.join()
+        returncode = process.wait()
+    return returncode, "".join(stdout_tail), "".join(stderr_tail)
+
+
+def run_ocr_in_process(input_path: str, output_path: str, ocr_kwargs: dict[str, Any]) -> tuple[int, str, str]:
+    """Run ``ocrmypdf.ocr()`` in this process, mapping failures onto ocrmypdf's exit codes."""
+    import ocrmypdf
+
+    try:
+        exit_code = ocrmypdf.ocr(input_path, output_path, progress_bar=False, **ocr_kwargs)
+    except ocrmypdf.ExitCodeException as error:
+        return int(error.exit_code), "", str(error)
+    except ValueError as error:  # Option combinations rejected by ocrmypdf's own validation.
+        return int(ocrmypdf.ExitCode.bad_args), "", str(error)
+    except Exception as error:
+        # ocr() bypasses the CLI's exception handler, which reports anything unexpected as "other error".
+        LOGGER.exception(
+            "ocrmypdf raised an unexpected error",
+            extra={"structured_data": {"input": input_path, "output": output_path}},
+        )
+        return int(ocrmypdf.ExitCode.other_error), "", f"{type(error).__name__}: {error}"
+    return int(exit_code), "", ""
 
 
 def run_ocr_job(
@@ -85,62 +360,84 @@ def run_ocr_job(
     output_path: Path,
     profile: OCRProfile,
     extra_args: tuple[str, ...],
+    ocr_kwargs: dict[str, Any] | None = None,
 ) -> OCRJobSummary:
-    """Execute an ``ocrmypdf`` invocation and capture structured metadata."""
+    """Execute an ``ocrmypdf`` invocation and capture structured metadata.
+
+    When ``ocr_kwargs`` is given, OCR runs in-process through ``ocrmypdf.ocr()``;
+    otherwise the ocrmypdf executable is spawned.
+    """
+    input_str = os.fspath(input_path)
+    output_str = os.fspath(output_path)
     command = [
-        "ocrmypdf",
+        OCRMYPDF_BIN,
         *profile.ocrmypdf_args,
         *extra_args,
-        str(input_path),
-        str(output_path),
+        input_str,
+        output_str,
     ]
     LOGGER.info(
         "Running ocrmypdf",
         extra={
             "structured_data": {
-                "input": str(input_path),
-                "output": str(output_path),
+                "input": input_str,
+                "output": output_str,
                 "profile": profile.name,
                 "command": command,
             }
         },
     )
-    completed = subprocess.run(
-        command,
-        check=False,
-        capture_output=True,
-        text=True,
-    )
+    for attempt in range(1, RETRY_ATTEMPTS + 1):
+        if ocr_kwargs is None:
+            returncode, stdout, stderr = run_ocr_subprocess(command)
+        else:
+            returncode, stdout, stderr = run_ocr_in_process(input_str, output_str, ocr_kwargs)
+        if returncode not in profile.retry_returncodes or attempt == RETRY_ATTEMPTS:
+            break
+        delay = 2 ** (attempt - 1)
+        LOGGER.warning(
+            "ocrmypdf failed with a retryable exit code",
+            extra={
+                "structured_data": {
+                    "input": input_str,
+                    "returncode": returncode,
+                    "attempt": attempt,
+                    "retry_in_seconds": delay,
+                }
+            },
+        )
+        time.sleep(delay)
     summary: OCRJobSummary = {
-        "input": str(input_path),
-        "output": str(output_path),
+        "input": input_str,
+        "output": output_str,
         "profile": profile.name,
-        "returncode": completed.returncode,
+        "returncode": returncode,
+        "attempts": attempt,
     }
-    if completed.stdout:
-        summary["stdout"] = completed.stdout
-    if completed.stderr:
-        summary["stderr"] = completed.stderr
-    if completed.returncode == 0:
+    if stdout:
+        summary["stdout"] = stdout
+    if stderr:
+        summary["stderr"] = stderr
+    if returncode == 0:
         LOGGER.info(
             "ocrmypdf succeeded",
-            extra={"structured_data": {"input": str(input_path), "output": str(output_path)}},
+            extra={"structured_data": {"input": input_str, "output": output_str}},
         )
     else:
         LOGGER.error(
             "ocrmypdf failed",
             extra={
                 "structured_data": {
-                    "input": str(input_path),
-                    "output": str(output_path),
-                    "returncode": completed.returncode,
+                    "input": input_str,
+                    "output": output_str,
+                    "returncode": returncode,
                 }
             },
         )
     return summary
 
 
-def handle_file_command(args: argparse.Namespace, profiles: dict[str, OCRProfile]) -> int:
+def handle_file_command(args: argparse.Namespace, resolve_profile: Callable[[str], OCRProfile]) -> int:
     """Handle the ``file`` subcommand."""
     input_path = Path(args.input).expanduser().resolve()
     if not input_path.exists():
@@ -152,52 +449,196 @@ def handle_file_command(args: argparse.Namespace, profiles: dict[str, OCRProfile
     output_path = Path(args.output).expanduser().resolve() if args.output else input_path.with_suffix(".ocr.pdf")
     output_path.parent.mkdir(parents=True, exist_ok=True)
     try:
-        profile = resolve_profile(args.profile, profiles)
+        profile = resolve_profile(args.profile)
     except KeyError as error:
         LOGGER.error("Profile resolution failed", extra={"structured_data": {"profile": args.profile}})
         raise SystemExit(str(error)) from error
     extra_args = tuple(args.ocrmypdf_arg or [])
-    summary = run_ocr_job(input_path=input_path, output_path=output_path, profile=profile, extra_args=extra_args)
-    print(json.dumps(summary))
+    summary = run_ocr_job(
+        input_path=input_path,
+        output_path=output_path,
+        profile=profile,
+        extra_args=extra_args,
+        ocr_kwargs=select_ocr_kwargs(args, profile, extra_args),
+    )
+    emit_json(summary)
     return int(summary["returncode"])
 
 
-def iter_pdfs(root: Path) -> Iterable[Path]:
-    """Yield PDF files under ``root`` ordered for deterministic processing."""
+def process_pdf(
+    input_path: Path,
+    output_path: Path,
+    profile: OCRProfile,
+    extra_args: tuple[str, ...],
+    ocr_kwargs: dict[str, Any] | None,
+    validate: bool,
+) -> OCRJobSummary:
+    """Run OCR for one batch entry and optionally validate the generated PDF."""
+    summary = run_ocr_job(input_path, output_path, profile, extra_args, ocr_kwargs)
+    if validate and summary["returncode"] == 0:
+        from scripts.validate_pdf import validate_pdf  # Local import to avoid circular runtime dependency
+
+        validation: ValidationSummary = validate_pdf(output_path)
+        summary["validation"] = validation
+    return summary
+
+
+def sets_ocrmypdf_jobs(args: Iterable[str]) -> bool:
+    """Return ``True`` when ``args`` already configure ocrmypdf's ``--jobs`` option."""
+    return any(arg in ("-j", "--jobs") or arg.startswith(("-j", "--jobs=")) for arg in args)
+
+
+def iter_pdfs(root: Path, recursive: bool = False, exclude_dir: Path | None = None) -> Iterable[Path]:
+    """Yield PDF files under ``root`` in inode order, approximating their on-disk layout.
+
+    With ``recursive``, subdirectories are walked too and files are yielded directory by
+    directory in name order. ``exclude_dir`` is never descended into, so an output
+    directory nested inside ``root`` does not feed earlier results back in as inputs.
+    """
     if not root.exists():
         LOGGER.warning(
             "Input directory does not exist",
             extra={"structured_data": {"input_dir": str(root)}},
         )
         return
-    for path in sorted(root.glob("*.pdf")):
-        if path.is_file():
-            yield path
+    if recursive:
+        excluded = os.fspath(exclude_dir) if exclude_dir is not None else None
+        # os.walk only hands back names, so no Path objects are built for non-PDF entries.
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames[:] = sorted(name for name in dirnames if os.path.join(dirpath, name) != excluded)
+            for filename in sorted(filenames):
+                if not filename.endswith(".pdf"):
+                    continue
+                file_path = os.path.join(dirpath, filename)
+                # Match the flat scan, which skips broken symlinks and other non-regular entries.
+                if os.path.isfile(file_path):
+                    yield Path(file_path)
+        return
+    # DirEntry.is_file() uses the file type cached from the directory listing, avoiding a stat per entry.
+    with os.scandir(root) as entries:
+        pdf_entries = [entry for entry in entries if entry.name.endswith(".pdf") and entry.is_file()]
+    pdf_entries.sort(key=lambda entry: entry.inode())
+    for entry in pdf_entries:
+        yield Path(entry.path)
+
+
+def run_jobs(
+    executor: Executor,
+    jobs: Iterable[tuple[Path, Path]],
+    run_job: Callable[[Path, Path], OCRJobSummary],
+) -> tuple[list[OCRJobSummary], list[tuple[Path, Path]]]:
+    """Run ``(input, output)`` jobs on ``executor``.
+
+    Returns the summaries of finished jobs and the jobs lost because the executor broke,
+    e.g. when a worker process was killed by the OOM killer or crashed in native code.
+    """
+    summaries: list[OCRJobSummary] = []
+    lost_jobs: list[tuple[Path, Path]] = []
+    with executor:
+        try:
+            futures: dict[Future[OCRJobSummary], tuple[Path, Path]] = {}
+            for job in jobs:
+                try:
+                    futures[executor.submit(run_job, *job)] = job
+                except BrokenExecutor:
+                    lost_jobs.append(job)
+            for future in as_completed(futures):
+                try:
+                    summaries.append(future.result())
+                except BrokenExecutor:
+                    lost_jobs.append(futures[future])
+        except BaseException:
+            # On Ctrl-C or a failed job, drop queued files instead of waiting for the whole batch.
+            executor.shutdown(cancel_futures=True)
+            raise
+    return summaries, lost_jobs
+
+
+def run_batch_jobs(
+    make_executor: Callable[[int], Executor],
+    jobs: Iterable[tuple[Path, Path]],
+    run_job: Callable[[Path, Path], OCRJobSummary],
+    max_workers: int,
+) -> tuple[list[OCRJobSummary], list[tuple[Path, Path]]]:
+    """Run ``jobs`` on an executor from ``make_executor`` and return summaries and crashed jobs.
+
+    A dead worker process breaks the whole pool and fails every pending job with it, so
+    each lost job is rerun alone on a fresh single-worker executor. Only jobs that break
+    that executor too are reported as crashed.
+    """
+    summaries, lost_jobs = run_jobs(make_executor(max_workers), jobs, run_job)
+    crashed_jobs: list[tuple[Path, Path]] = []
+    for job in sorted(lost_jobs):
+        rerun_summaries, rerun_lost = run_jobs(make_executor(1), [job], run_job)
+        summaries.extend(rerun_summaries)
+        crashed_jobs.extend(rerun_lost)
+    return summaries, crashed_jobs
+
+
+def crashed_job_summary(input_path: Path, output_path: Path, profile: OCRProfile) -> OCRJobSummary:
+    """Return the summary recorded for a file whose OCR worker process died."""
+    import ocrmypdf  # Only in-process OCR runs in worker processes that can die.
+
+    LOGGER.error(
+        "OCR worker process terminated abruptly",
+        extra={"structured_data": {"input": str(input_path), "output": str(output_path)}},
+    )
+    return {
+        "input": str(input_path),
+        "output": str(output_path),
+        "profile": profile.name,
+        "returncode": int(ocrmypdf.ExitCode.other_error),
+        "attempts": 1,
+        "stderr": "OCR worker process terminated abruptly",
+    }
 
 
-def handle_batch_command(args: argparse.Namespace, profiles: dict[str, OCRProfile]) -> int:
+def handle_batch_command(args: argparse.Namespace, resolve_profile: Callable[[str], OCRProfile]) -> int:
     """Handle the ``batch`` subcommand."""
     input_dir = Path(args.input_dir).expanduser().resolve()
     output_dir = Path(args.output_dir).expanduser().resolve()
     output_dir.mkdir(parents=True, exist_ok=True)
     try:
-        profile = resolve_profile(args.profile, profiles)
+        profile = resolve_profile(args.profile)
     except KeyError as error:
         LOGGER.error("Profile resolution failed", extra={"structured_data": {"profile": args.profile}})
         raise SystemExit(str(error)) from error
     extra_args = tuple(args.ocrmypdf_arg or [])
-    summaries: list[OCRJobSummary] = []
-    exit_codes: list[int] = []
-    for pdf_path in iter_pdfs(input_dir):
-        target_path = output_dir / pdf_path.name
-        summary = run_ocr_job(pdf_path, target_path, profile, extra_args)
-        summaries.append(summary)
-        exit_codes.append(int(summary["returncode"]))
-        if args.validate and summary["returncode"] == 0:
-            from scripts.validate_pdf import validate_pdf  # Local import to avoid circular runtime dependency
-
-            validation: ValidationSummary = validate_pdf(target_path)
-            summaries[-1]["validation"] = validation
+    if args.jobs > 1 and not sets_ocrmypdf_jobs((*profile.ocrmypdf_args, *extra_args)):
+        # Files already run in parallel; keep each ocrmypdf single-threaded to avoid oversubscription.
+        extra_args = (*extra_args, "--jobs", "1")
+    ocr_kwargs = select_ocr_kwargs(args, profile, extra_args)
+    make_executor: Callable[[int], Executor]
+    if ocr_kwargs is None:
+        # Threads suffice here because each job blocks on its own ocrmypdf subprocess.
+        make_executor = ThreadPoolExecutor
+    else:
+        from concurrent.futures import ProcessPoolExecutor  # Deferred: pulls in multiprocessing and subprocess.
+
+        pool_options: dict[str, Any] = {}
+        if sys.version_info >= (3, 11):
+            # Recycle workers so memory leaked or fragmented by native OCR libraries is returned.
+            pool_options["max_tasks_per_child"] = OCR_WORKER_MAX_TASKS
+        # ocrmypdf.ocr() runs one task per process, so each worker process takes files one at a time.
+        make_executor = functools.partial(ProcessPoolExecutor, initializer=init_ocr_worker, **pool_options)
+    jobs: list[tuple[Path, Path]] = []
+    for pdf_path in iter_pdfs(input_dir, recursive=args.recursive, exclude_dir=output_dir):
+        # Mirror the input layout so files with the same name in different directories do not collide.
+        target_path = output_dir / pdf_path.relative_to(input_dir)
+        if args.recursive:
+            target_path.parent.mkdir(parents=True, exist_ok=True)
+        jobs.append((pdf_path, target_path))
+    run_job = functools.partial(
+        process_pdf,
+        profile=profile,
+        extra_args=extra_args,
+        ocr_kwargs=ocr_kwargs,
+        validate=args.validate,
+    )
+    summaries, crashed_jobs = run_batch_jobs(make_executor, jobs, run_job, args.jobs)
+    summaries.extend(crashed_job_summary(*job, profile) for job in crashed_jobs)
+    summaries.sort(key=lambda summary: summary["input"])
+    exit_codes = [int(summary["returncode"]) for summary in summaries]
     batch_summary: OCRBatchSummary = {
         "profile": profile.name,
         "input_dir": str(input_dir),
@@ -206,10 +647,21 @@ def handle_batch_command(args: argparse.Namespace, profiles: dict[str, OCRProfil
         "failed": sum(code != 0 for code in exit_codes),
         "succeeded": sum(code == 0 for code in exit_codes),
     }
-    print(json.dumps(batch_summary))
+    emit_json(batch_summary)
     return 0 if all(code == 0 for code in exit_codes) else 1
 
 
+def positive_int(value: str) -> int:
+    """Parse a strictly positive integer command-line value."""
+    try:
+        number = int(value)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(f"invalid integer value: '{value}'") from exc
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"value must be at least 1, got {number}")
+    return number
+
+
 def build_parser() -> argparse.ArgumentParser:
     """Create the top-level argument parser."""
     parser = argparse.ArgumentParser(description="CLI wrapper around ocrmypdf with profile support")
@@ -229,6 +681,14 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Enable debug logging.",
     )
+    parser.add_argument(
+        "--subprocess",
+        action="store_true",
+        help=(
+            "Spawn the ocrmypdf executable for every file instead of running OCR in-process "
+            "through the ocrmypdf Python API."
+        ),
+    )
     subparsers = parser.add_subparsers(dest="command", required=True)
 
     file_parser = subparsers.add_parser("file", help="Process a single PDF file")
@@ -260,6 +720,20 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Run post-processing validation on the generated PDFs.",
     )
+    batch_parser.add_argument(
+        "--recursive",
+        action="store_true",
+        help="Also process PDFs in subdirectories, mirroring the directory layout in the output directory.",
+    )
+    batch_parser.add_argument(
+        "--jobs",
+        type=positive_int,
+        default=os.cpu_count() or 1,
+        help=(
+            "Number of PDFs to process concurrently. Defaults to the CPU count. When greater "
+            "than 1, each ocrmypdf run is limited to '--jobs 1' unless overridden."
+        ),
+    )
     batch_parser.add_argument(
         "--ocrmypdf-arg",
         action="append",
@@ -276,13 +750,13 @@ def main(argv: list[str] | None = None) -> int:
     parser = build_parser()
     args = parser.parse_args(argv)
     configure_logging(verbose=args.verbose)
-    profiles = load_profiles(Path(args.profiles))
+    resolve_profile = make_resolver(load_profiles(Path(args.profiles)))
     try:
         handler = args.handler
     except AttributeError:
         parser.error("No command provided.")
         return 1
-    return handler(args, profiles)
+    return handler(args, resolve_profile)
 
 
 if __name__ == "__main__":
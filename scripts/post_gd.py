@@ -3,8 +3,9 @@
 
 This script locates executable hook files stored under ``scripts/gd_hooks``
 and runs them sequentially after the developer triggers their ``gd`` command
-(e.g., ``git diff``). The hooks can encapsulate database migrations, data
-refreshes, or any additional automation needed to keep the environment in sync.
+(e.g., ``git diff``). With ``--continue-on-error --parallel N`` up to N hooks
+run concurrently instead. The hooks can encapsulate database migrations, data refreshes, or any
+additional automation needed to keep the environment in sync.
 """
 
 from __future__ import annotations
@@ -13,6 +14,7 @@ import argparse
 import os
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Iterable
 
@@ -51,7 +53,31 @@ def parse_args(argv: Iterable[str] | None = None) -> argparse.Namespace:
             "status. By default, execution stops on the first failure."
         ),
     )
-    return parser.parse_args(argv)
+    parser.add_argument(
+        "--parallel",
+        type=positive_int,
+        metavar="N",
+        help=(
+            "Run up to N hooks concurrently. Requires --continue-on-error. "
+            "By default, hooks run one at a time in lexical order."
+        ),
+    )
+    args = parser.parse_args(argv)
+    if args.parallel is not None and not args.continue_on_error:
+        parser.error("--parallel requires --continue-on-error")
+    return args
+
+
+def positive_int(value: str) -> int:
+    """Parse a strictly positive integer command-line value."""
+
+    try:
+        number = int(value)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(f"invalid integer value: '{value}'") from exc
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"value must be at least 1, got {number}")
+    return number
 
 
 def collect_hooks(hooks_dir: Path) -> list[Path]:
@@ -77,6 +103,31 @@ def run_hook(hook: Path) -> int:
     return process.returncode
 
 
+def report_result(hook: Path, exit_code: int) -> None:
+    """Print the outcome of a finished hook."""
+
+    if exit_code != 0:
+        print(f"[post-gd] ✗ Hook {hook.name} failed with exit code {exit_code}.")
+    else:
+        print(f"[post-gd] ✓ Hook {hook.name} completed successfully.")
+
+
+def start_hook(hook: Path) -> int:
+    """Announce and execute a hook once a worker picks it up."""
+
+    print(f"[post-gd] → Executing {hook.name}")
+    return run_hook(hook)
+
+
+def run_hooks_parallel(hooks: list[Path], max_workers: int) -> None:
+    """Run independent hooks concurrently, reporting results as they finish."""
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(start_hook, hook): hook for hook in hooks}
+        for future in as_completed(futures):
+            report_result(futures[future], future.result())
+
+
 def main(argv: Iterable[str] | None = None) -> int:
     """Entry-point coordinating hook discovery and execution."""
 
@@ -90,18 +141,20 @@ def main(argv: Iterable[str] | None = None) -> int:
 
     print(f"[post-gd] Running {len(hooks)} hook(s) from {hooks_dir}...")
 
+    # Hooks may depend on each other, so they only run concurrently when explicitly requested.
+    if args.parallel is not None and args.parallel > 1 and not args.dry_run:
+        run_hooks_parallel(hooks, args.parallel)
+        return 0
+
     for hook in hooks:
         print(f"[post-gd] → Executing {hook.name}")
         if args.dry_run:
             continue
 
         exit_code = run_hook(hook)
-        if exit_code != 0:
-            print(f"[post-gd] ✗ Hook {hook.name} failed with exit code {exit_code}.")
-            if not args.continue_on_error:
-                return exit_code
-        else:
-            print(f"[post-gd] ✓ Hook {hook.name} completed successfully.")
+        report_result(hook, exit_code)
+        if exit_code != 0 and not args.continue_on_error:
+            return exit_code
 
     if args.dry_run:
         print("[post-gd] Dry run complete. No hooks were executed.")
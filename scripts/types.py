@@ -22,6 +22,7 @@ class OCRJobSummary(TypedDict):
     output: str
     profile: str
     returncode: int
+    attempts: int
     stdout: NotRequired[str]
     stderr: NotRequired[str]
     validation: NotRequired[ValidationSummary]
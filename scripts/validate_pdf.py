@@ -3,15 +3,20 @@ from __future__ import annotations
 import argparse
 import json
 import logging
+import os
 import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Sequence
+from typing import IO, Sequence
 
 from scripts.types import ValidationCommandResult, ValidationSummary
 
 LOGGER = logging.getLogger("validate_pdf")
 LOGGER.propagate = False
 
+MAX_PREVIEW_BYTES = 4096  # Prevent log spam by limiting collected output.
+
 
 def configure_logging(verbose: bool) -> None:
     """Configure structured logging for validation."""
@@ -23,15 +28,36 @@ def configure_logging(verbose: bool) -> None:
     LOGGER.setLevel(logging.DEBUG if verbose else logging.INFO)
 
 
-def run_command(command: Sequence[str]) -> ValidationCommandResult:
+def read_preview(stream: IO[bytes], preview: bytearray, limit: int) -> None:
+    """Keep the first ``limit`` bytes of ``stream`` in ``preview`` and discard the rest as it arrives."""
+    with stream:
+        preview.extend(stream.read(limit))
+        # Keep draining so the child never blocks on a full pipe.
+        while stream.read(64 * 1024):
+            pass
+
+
+def run_command(command: Sequence[str], capture_stdout: bool = True) -> ValidationCommandResult:
     """Run an external command and return structured results."""
-    completed = subprocess.run(command, capture_output=True, text=True, check=False)
-    max_preview = 4096  # Prevent log spam by limiting collected output.
+    stdout_target = subprocess.PIPE if capture_stdout else subprocess.DEVNULL
+    stdout = bytearray()
+    stderr = bytearray()
+    with subprocess.Popen(command, stdout=stdout_target, stderr=subprocess.PIPE) as process:
+        # Drain stderr on a helper thread so neither pipe can fill up and stall the command.
+        stderr_reader = threading.Thread(
+            target=read_preview, args=(process.stderr, stderr, MAX_PREVIEW_BYTES), daemon=True
+        )
+        stderr_reader.start()
+        if process.stdout:
+            read_preview(process.stdout, stdout, MAX_PREVIEW_BYTES)
+        stderr_reader.join()
+        returncode = process.wait()
+    # Only the previews are decoded; "replace" covers a multi-byte character cut at the limit.
     return {
         "command": list(command),
-        "returncode": completed.returncode,
-        "stdout": completed.stdout[:max_preview],
-        "stderr": completed.stderr[:max_preview],
+        "returncode": returncode,
+        "stdout": stdout.decode("utf-8", errors="replace"),
+        "stderr": stderr.decode("utf-8", errors="replace"),
     }
 
 
@@ -39,12 +65,18 @@ def validate_pdf(pdf_path: Path) -> ValidationSummary:
     """Validate a PDF by calling pdfinfo and pdftotext."""
     commands = {
         "pdfinfo": ["pdfinfo", str(pdf_path)],
-        "pdftotext": ["pdftotext", "-q", str(pdf_path), "-"],
+        # Only the exit status matters, so pdftotext writes the extracted text to the null device.
+        "pdftotext": ["pdftotext", "-q", str(pdf_path), os.devnull],
     }
-    results: ValidationSummary = {}
-    for name, command in commands.items():
-        outcome = run_command(command)
-        results[name] = outcome
+    discard_stdout = {"pdftotext"}
+    # The tools are independent, so run them side by side instead of back to back.
+    with ThreadPoolExecutor(max_workers=len(commands)) as executor:
+        future_map = {
+            name: executor.submit(run_command, command, capture_stdout=name not in discard_stdout)
+            for name, command in commands.items()
+        }
+        results: ValidationSummary = {name: future.result() for name, future in future_map.items()}
+    for name, outcome in results.items():
         level = logging.INFO if outcome["returncode"] == 0 else logging.ERROR
         LOGGER.log(level, "%s completed with code %s", name, outcome["returncode"])
     return results
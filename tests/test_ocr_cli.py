@@ -0,0 +1,299 @@
+from __future__ import annotations
+
+import argparse
+import functools
+import json
+import logging
+import multiprocessing
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from scripts import ocr_cli
+from scripts.ocr_cli import (
+    PROFILE_CACHE_SLOTS,
+    JsonLogFormatter,
+    OCRProfile,
+    build_profiles,
+    emit_json,
+    handle_batch_command,
+    iter_pdfs,
+    make_resolver,
+    positive_int,
+    profile_cache_path,
+    read_profile_cache,
+    run_batch_jobs,
+    run_ocr_job,
+    sets_ocrmypdf_jobs,
+    write_profile_cache,
+)
+
+# What os.fsdecode() returns for the file name b"b\xff.pdf", which is not valid UTF-8.
+SURROGATE_PATH = "b\udcff.pdf"
+
+
+def make_batch_args(input_dir: Path, output_dir: Path, **overrides: Any) -> argparse.Namespace:
+    """Return parsed ``batch`` arguments that spawn ocrmypdf on a single worker."""
+    values: dict[str, Any] = {
+        "input_dir": input_dir,
+        "output_dir": output_dir,
+        "profile": "fast",
+        "ocrmypdf_arg": None,
+        "jobs": 1,
+        "recursive": False,
+        "validate": False,
+        "subprocess": True,
+    }
+    values.update(overrides)
+    return argparse.Namespace(**values)
+
+
+def resolve_fast(name: str) -> OCRProfile:
+    return OCRProfile(name=name, description="", ocrmypdf_args=("--skip-text",))
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        ("-j", "2"),
+        ("--jobs", "2"),
+        ("-j2",),
+        ("--jobs=2",),
+        ("--skip-text", "--jobs", "4"),
+    ],
+)
+def test_sets_ocrmypdf_jobs_detects_jobs_option(args: tuple[str, ...]) -> None:
+    assert sets_ocrmypdf_jobs(args)
+
+
+def test_sets_ocrmypdf_jobs_ignores_other_options() -> None:
+    assert not sets_ocrmypdf_jobs(("--skip-text", "--optimize=2", "--jbig2-lossy"))
+
+
+def test_make_resolver_returns_known_profiles() -> None:
+    profile = OCRProfile(name="fast", description="", ocrmypdf_args=("--skip-text",))
+    assert make_resolver({"fast": profile})("fast") is profile
+
+
+def test_make_resolver_lists_available_profiles_for_unknown_names() -> None:
+    profiles = {
+        name: OCRProfile(name=name, description="", ocrmypdf_args=()) for name in ("fast", "balanced")
+    }
+    with pytest.raises(KeyError, match="Unknown profile 'archival'. Available profiles: balanced, fast"):
+        make_resolver(profiles)("archival")
+
+
+def test_build_profiles_reads_retry_returncodes() -> None:
+    profiles = build_profiles({"fast": {"ocrmypdf_args": ["--skip-text"], "retry_returncodes": [15, 130]}})
+    assert profiles["fast"].retry_returncodes == (15, 130)
+
+
+@pytest.mark.parametrize("retry_returncodes", [15, "15", [True], [15, "15"], None])
+def test_build_profiles_rejects_invalid_retry_returncodes(retry_returncodes: object) -> None:
+    with pytest.raises(ValueError, match="'retry_returncodes' as a list of integers"):
+        build_profiles({"fast": {"ocrmypdf_args": [], "retry_returncodes": retry_returncodes}})
+
+
+@pytest.mark.parametrize(("value", "expected"), [("1", 1), ("8", 8)])
+def test_positive_int_accepts_positive_values(value: str, expected: int) -> None:
+    assert positive_int(value) == expected
+
+
+@pytest.mark.parametrize("value", ["0", "-1", "two", "1.5"])
+def test_positive_int_rejects_other_values(value: str) -> None:
+    with pytest.raises(argparse.ArgumentTypeError):
+        positive_int(value)
+
+
+def test_json_log_formatter_encodes_surrogate_escaped_paths() -> None:
+    record = logging.LogRecord("ocr_cli", logging.INFO, __file__, 1, "Running ocrmypdf", None, None)
+    record.structured_data = {"input": SURROGATE_PATH}
+    payload = json.loads(JsonLogFormatter().format(record))
+    assert payload["event"] == "Running ocrmypdf"
+    assert payload["input"] == SURROGATE_PATH
+
+
+def test_emit_json_encodes_surrogate_escaped_paths(capsys: pytest.CaptureFixture[str]) -> None:
+    emit_json({"input": SURROGATE_PATH})
+    output = capsys.readouterr().out
+    assert output.endswith("\n")
+    assert json.loads(output) == {"input": SURROGATE_PATH}
+
+
+def test_batch_summary_includes_non_utf8_file_names(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    input_dir = tmp_path / "in"
+    input_dir.mkdir()
+    (input_dir / os.fsdecode(b"b\xff.pdf")).touch()
+    monkeypatch.setattr(ocr_cli, "run_ocr_subprocess", lambda command: (0, "", ""))
+
+    assert handle_batch_command(make_batch_args(input_dir, tmp_path / "out"), resolve_fast) == 0
+
+    summary = json.loads(capsys.readouterr().out)
+    assert summary["succeeded"] == 1
+    assert summary["results"][0]["input"] == str(input_dir / SURROGATE_PATH)
+
+
+def summarize_or_crash(input_path: Path, output_path: Path) -> dict[str, Any]:
+    """Stand-in OCR job whose worker process dies on ``crash.pdf``."""
+    if input_path.name == "crash.pdf":
+        os._exit(1)
+    return {"input": str(input_path), "output": str(output_path), "returncode": 0}
+
+
+def test_run_batch_jobs_isolates_the_job_that_kills_its_worker() -> None:
+    make_executor = functools.partial(ProcessPoolExecutor, mp_context=multiprocessing.get_context("fork"))
+    jobs = [(Path(f"/in/{name}.pdf"), Path(f"/out/{name}.pdf")) for name in ("a", "b", "crash", "c", "d")]
+
+    summaries, crashed_jobs = run_batch_jobs(make_executor, jobs, summarize_or_crash, 2)
+
+    assert crashed_jobs == [(Path("/in/crash.pdf"), Path("/out/crash.pdf"))]
+    inputs = sorted(summary["input"] for summary in summaries)
+    assert inputs == ["/in/a.pdf", "/in/b.pdf", "/in/c.pdf", "/in/d.pdf"]
+
+
+def run_job_with_returncodes(
+    monkeypatch: pytest.MonkeyPatch, profile: OCRProfile, returncodes: list[int]
+) -> tuple[dict[str, Any], list[float]]:
+    """Run one subprocess OCR job whose attempts exit with ``returncodes`` in turn."""
+    remaining = iter(returncodes)
+    sleeps: list[float] = []
+    monkeypatch.setattr(ocr_cli, "run_ocr_subprocess", lambda command: (next(remaining), "", ""))
+    monkeypatch.setattr(ocr_cli.time, "sleep", sleeps.append)
+    summary = run_ocr_job(Path("in.pdf"), Path("out.pdf"), profile, ())
+    return dict(summary), sleeps
+
+
+def test_run_ocr_job_retries_retryable_returncodes_with_backoff(monkeypatch: pytest.MonkeyPatch) -> None:
+    profile = OCRProfile(name="fast", description="", ocrmypdf_args=(), retry_returncodes=(15,))
+    summary, sleeps = run_job_with_returncodes(monkeypatch, profile, [15, 15, 0])
+    assert (summary["returncode"], summary["attempts"]) == (0, 3)
+    assert sleeps == [1, 2]
+
+
+def test_run_ocr_job_gives_up_after_the_last_attempt(monkeypatch: pytest.MonkeyPatch) -> None:
+    profile = OCRProfile(name="fast", description="", ocrmypdf_args=(), retry_returncodes=(15,))
+    summary, sleeps = run_job_with_returncodes(monkeypatch, profile, [15, 15, 15, 0])
+    assert (summary["returncode"], summary["attempts"]) == (15, 3)
+    assert sleeps == [1, 2]
+
+
+def test_run_ocr_job_stops_on_non_retryable_returncodes(monkeypatch: pytest.MonkeyPatch) -> None:
+    profile = OCRProfile(name="fast", description="", ocrmypdf_args=(), retry_returncodes=(15,))
+    summary, sleeps = run_job_with_returncodes(monkeypatch, profile, [2, 0])
+    assert (summary["returncode"], summary["attempts"]) == (2, 1)
+    assert sleeps == []
+
+
+def test_run_ocr_job_does_not_retry_by_default(monkeypatch: pytest.MonkeyPatch) -> None:
+    profile = OCRProfile(name="fast", description="", ocrmypdf_args=())
+    summary, sleeps = run_job_with_returncodes(monkeypatch, profile, [15, 0])
+    assert (summary["returncode"], summary["attempts"]) == (15, 1)
+    assert sleeps == []
+
+
+def make_pdfs(root: Path, *relative_paths: str) -> None:
+    for relative_path in relative_paths:
+        path = root / relative_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.touch()
+
+
+def test_iter_pdfs_recursive_walks_directories_in_name_order(tmp_path: Path) -> None:
+    make_pdfs(tmp_path, "b.pdf", "a.pdf", "notes.txt", "sub/z.pdf", "sub/deeper/y.pdf", "other/x.pdf")
+    found = [path.relative_to(tmp_path).as_posix() for path in iter_pdfs(tmp_path, recursive=True)]
+    assert found == ["a.pdf", "b.pdf", "other/x.pdf", "sub/z.pdf", "sub/deeper/y.pdf"]
+
+
+def test_iter_pdfs_recursive_prunes_the_excluded_directory(tmp_path: Path) -> None:
+    make_pdfs(tmp_path, "a.pdf", "out/a.pdf", "out/sub/b.pdf", "sub/b.pdf")
+    found = [
+        path.relative_to(tmp_path).as_posix()
+        for path in iter_pdfs(tmp_path, recursive=True, exclude_dir=tmp_path / "out")
+    ]
+    assert found == ["a.pdf", "sub/b.pdf"]
+
+
+@pytest.mark.parametrize("recursive", [False, True])
+def test_iter_pdfs_skips_broken_symlinks(tmp_path: Path, recursive: bool) -> None:
+    make_pdfs(tmp_path, "a.pdf")
+    (tmp_path / "broken.pdf").symlink_to(tmp_path / "missing.pdf")
+    assert list(iter_pdfs(tmp_path, recursive=recursive)) == [tmp_path / "a.pdf"]
+
+
+def test_recursive_batch_mirrors_layout_without_collisions(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    input_dir = tmp_path / "in"
+    output_dir = input_dir / "out"
+    make_pdfs(input_dir, "2023/report.pdf", "2024/report.pdf", "out/earlier.pdf")
+    monkeypatch.setattr(ocr_cli, "run_ocr_subprocess", lambda command: (0, "", ""))
+
+    args = make_batch_args(input_dir, output_dir, recursive=True)
+    assert handle_batch_command(args, resolve_fast) == 0
+
+    results = json.loads(capsys.readouterr().out)["results"]
+    assert [(result["input"], result["output"]) for result in results] == [
+        (str(input_dir / "2023/report.pdf"), str(output_dir / "2023/report.pdf")),
+        (str(input_dir / "2024/report.pdf"), str(output_dir / "2024/report.pdf")),
+    ]
+    assert (output_dir / "2023").is_dir() and (output_dir / "2024").is_dir()
+
+
+@pytest.fixture
+def cache_path(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    path = tmp_path / "cache" / "profiles.pkl"
+    monkeypatch.setattr(ocr_cli, "PROFILE_CACHE_PATH", path)
+    return path
+
+
+def test_profile_cache_round_trips_raw_profiles(cache_path: Path) -> None:
+    raw_profiles = {"fast": {"ocrmypdf_args": ["--skip-text"]}}
+    write_profile_cache(("/profiles.yaml", 1, 10), raw_profiles)
+    assert read_profile_cache(("/profiles.yaml", 1, 10)) == raw_profiles
+    assert read_profile_cache(("/profiles.yaml", 2, 10)) is None
+    assert read_profile_cache(("/other.yaml", 1, 10)) is None
+
+
+def test_profile_cache_keeps_the_most_recently_written_files(cache_path: Path) -> None:
+    for index in range(PROFILE_CACHE_SLOTS):
+        write_profile_cache((f"/{index}.yaml", 1, 1), {"index": index})
+    write_profile_cache(("/0.yaml", 1, 1), {"index": 0})
+    write_profile_cache(("/new.yaml", 1, 1), {"index": "new"})
+    assert read_profile_cache(("/1.yaml", 1, 1)) is None
+    assert read_profile_cache(("/0.yaml", 1, 1)) == {"index": 0}
+    assert read_profile_cache(("/new.yaml", 1, 1)) == {"index": "new"}
+
+
+def test_profile_cache_replaces_the_old_single_slot_format(cache_path: Path) -> None:
+    cache_path.parent.mkdir(parents=True)
+    cache_path.write_bytes(pickle.dumps((("/profiles.yaml", 1, 10), {"fast": {}})))
+    assert read_profile_cache(("/profiles.yaml", 1, 10)) is None
+    write_profile_cache(("/profiles.yaml", 1, 10), {"fast": {}})
+    assert read_profile_cache(("/profiles.yaml", 1, 10)) == {"fast": {}}
+
+
+def test_failed_profile_cache_write_leaves_no_files(cache_path: Path) -> None:
+    write_profile_cache(("/profiles.yaml", 1, 10), {"unpicklable": lambda: None})
+    assert list(cache_path.parent.iterdir()) == []
+
+
+def test_profile_cache_path_honours_xdg_cache_home(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    assert profile_cache_path() == tmp_path / "ocr_cli" / "profiles.pkl"
+
+
+def test_profile_cache_is_disabled_without_a_home_directory(monkeypatch: pytest.MonkeyPatch) -> None:
+    def no_home() -> Path:
+        raise RuntimeError("Could not determine home directory.")
+
+    monkeypatch.delenv("XDG_CACHE_HOME", raising=False)
+    monkeypatch.setattr(Path, "home", no_home)
+    assert profile_cache_path() is None
+    assert read_profile_cache(("/profiles.yaml", 1, 10)) is None
+    write_profile_cache(("/profiles.yaml", 1, 10), {"fast": {}})
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import argparse
+
+import pytest
+
+# These tests exercise ocrmypdf's private option parser, so they only run where ocrmypdf is installed.
+pytest.importorskip("ocrmypdf")
+
+from ocrmypdf._plugin_manager import get_plugin_manager  # noqa: E402
+from ocrmypdf.api import create_options, get_parser  # noqa: E402
+
+from scripts.ocr_cli import OCRProfile, parse_ocrmypdf_args, select_ocr_kwargs  # noqa: E402
+
+
+def test_parse_ocrmypdf_args_keeps_only_non_default_options() -> None:
+    assert parse_ocrmypdf_args(["--skip-text", "--optimize=2", "--deskew", "--jobs", "1"]) == {
+        "skip_text": True,
+        "optimize": 2,
+        "deskew": True,
+        "jobs": 1,
+    }
+
+
+def test_parse_ocrmypdf_args_without_arguments_is_empty() -> None:
+    assert parse_ocrmypdf_args([]) == {}
+
+
+def test_parse_ocrmypdf_args_renames_languages_to_ocr_keyword() -> None:
+    assert parse_ocrmypdf_args(["-l", "eng+deu"]) == {"language": ["eng", "deu"]}
+
+
+def test_parse_ocrmypdf_args_does_not_leak_list_defaults_between_calls() -> None:
+    parse_ocrmypdf_args(["-l", "eng"])
+    assert parse_ocrmypdf_args(["-l", "deu"]) == {"language": ["deu"]}
+    assert parse_ocrmypdf_args([]) == {}
+
+
+def test_parse_ocrmypdf_args_drops_api_managed_options() -> None:
+    assert parse_ocrmypdf_args(["-v", "1", "--no-progress-bar"]) == {}
+
+
+def test_parse_ocrmypdf_args_rejects_unknown_options() -> None:
+    with pytest.raises(ValueError, match="unrecognized arguments: --pdfa-3"):
+        parse_ocrmypdf_args(["--pdfa-3"])
+
+
+def test_parsed_kwargs_are_accepted_by_ocr_options() -> None:
+    kwargs = parse_ocrmypdf_args(["--output-type", "pdfa-3", "-l", "eng+deu", "--optimize=3", "--clean"])
+    parser = get_parser()
+    get_plugin_manager([]).hook.add_options(parser=parser)
+    options = create_options(input_file="in.pdf", output_file="out.pdf", parser=parser, **kwargs)
+    assert options.output_type == "pdfa-3"
+    assert options.languages == ["eng", "deu"]
+    assert options.optimize == 3
+    assert options.clean is True
+
+
+def test_select_ocr_kwargs_exits_cleanly_on_rejected_profile_arguments() -> None:
+    profile = OCRProfile(name="archival", description="", ocrmypdf_args=("--pdfa-3",))
+    args = argparse.Namespace(subprocess=False)
+    with pytest.raises(SystemExit, match="Invalid ocrmypdf arguments for profile 'archival'"):
+        select_ocr_kwargs(args, profile, ())
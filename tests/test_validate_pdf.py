@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+import sys
+
+from scripts.validate_pdf import MAX_PREVIEW_BYTES, run_command
+
+# Writes more than the preview limit to both pipes, then exits with status 3.
+NOISY_COMMAND = [
+    sys.executable,
+    "-c",
+    "import sys; sys.stdout.write('o' * 100000); sys.stderr.write('e' * 100000); sys.exit(3)",
+]
+
+
+def test_run_command_caps_both_previews() -> None:
+    result = run_command(NOISY_COMMAND)
+    assert result["returncode"] == 3
+    assert result["stdout"] == "o" * MAX_PREVIEW_BYTES
+    assert result["stderr"] == "e" * MAX_PREVIEW_BYTES
+
+
+def test_run_command_can_discard_stdout() -> None:
+    result = run_command(NOISY_COMMAND, capture_stdout=False)
+    assert result["stdout"] == ""
+    assert result["stderr"] == "e" * MAX_PREVIEW_BYTES